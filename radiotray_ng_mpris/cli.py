@@ -2,8 +2,7 @@ import argparse
 import logging
 import os
 import sys
-from enum import Enum, auto
-from typing import Tuple
+from typing import Optional, Tuple
 
 from yacl import setup_colored_stderr_logging
 
@@ -20,12 +19,14 @@ from .wrap import setup_signal_handling, wrap_radiotray_ng
 logger = logging.getLogger(__name__)
 
 
-class Verbosity(Enum):
-    QUIET = auto()
-    ERROR = auto()
-    WARN = auto()
-    VERBOSE = auto()
-    DEBUG = auto()
+# `--warn` is always set (it is the default), so it must be checked last and is covered by the fallback level
+LOG_LEVELS: dict[str, Optional[int]] = {
+    "quiet": None,
+    "error": logging.ERROR,
+    "verbose": logging.INFO,
+    "debug": logging.DEBUG,
+}
+DEFAULT_LOG_LEVEL = logging.WARNING
 
 
 def get_argumentparser() -> argparse.ArgumentParser:
@@ -84,35 +85,20 @@ def parse_arguments() -> argparse.Namespace:
     args = parser.parse_args()
     if args.print_version:
         return args
-    args.verbosity_level = (
-        Verbosity.QUIET
-        if args.quiet
-        else (
-            Verbosity.ERROR
-            if args.error
-            else Verbosity.VERBOSE if args.verbose else Verbosity.DEBUG if args.debug else Verbosity.WARN
-        )
+    args.log_level = next(
+        (log_level for option_name, log_level in LOG_LEVELS.items() if getattr(args, option_name)), DEFAULT_LOG_LEVEL
     )
     return args
 
 
-def setup_stderr_logging(verbosity_level: Verbosity) -> None:
-    if verbosity_level == Verbosity.QUIET:
+def setup_stderr_logging(log_level: Optional[int]) -> None:
+    if log_level is None:
         logging.getLogger().handlers = []
-    elif verbosity_level == Verbosity.ERROR:
-        logging.basicConfig(level=logging.ERROR)
-    elif verbosity_level == Verbosity.WARN:
-        logging.basicConfig(level=logging.WARNING)
-    elif verbosity_level == Verbosity.VERBOSE:
-        logging.basicConfig(level=logging.INFO)
-    elif verbosity_level == Verbosity.DEBUG:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        raise NotImplementedError('The verbosity level "{}" is not implemented'.format(verbosity_level))
-    if not verbosity_level == Verbosity.QUIET:
-        # Only log critical registration errors to not spam the log
-        logging.getLogger("pydbus.registration").setLevel(logging.CRITICAL)
-        setup_colored_stderr_logging(format_string="[%(levelname)s] %(message)s")
+        return
+    logging.basicConfig(level=log_level)
+    # Only log critical registration errors to not spam the log
+    logging.getLogger("pydbus.registration").setLevel(logging.CRITICAL)
+    setup_colored_stderr_logging(format_string="[%(levelname)s] %(message)s")
 
 
 def main() -> None:
@@ -124,7 +110,7 @@ def main() -> None:
             sys.exit(0)
         if has_setup_colored_exceptions:
             setup_colored_exceptions(True)
-        setup_stderr_logging(args.verbosity_level)
+        setup_stderr_logging(args.log_level)
         setup_signal_handling()
         wrap_radiotray_ng(args.play)
     except Exception as e:
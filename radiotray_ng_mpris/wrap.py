@@ -1,13 +1,13 @@
 import json
 import logging
-import os
 import signal
 import subprocess
 import sys
 import time
 from pprint import pformat
 from types import FrameType
-from typing import Optional, cast
+from typing import Any, Callable, Optional, cast
+from xml.etree import ElementTree
 
 import pydbus
 from gi.repository import GLib
@@ -36,75 +36,249 @@ except ImportError:
     from mpris_server.base import RateDecimal as Rate
     from mpris_server.base import VolumeDecimal as Volume
 
-MAX_DBUS_GET_TRY_COUNT = 30
+BOOKMARKS_CACHE_TTL = 10.0  # s
+CONFIG_CACHE_TTL = 10.0  # s
+DBUS_GET_RETRY_INTERVAL = 200  # ms
+MAX_DBUS_GET_TRY_COUNT = 150
+PLAYER_STATE_CACHE_TTL = 0.1  # s
+RADIOTRAY_NG_DBUS_INTERFACE = "com.github.radiotray_ng"
+RADIOTRAY_NG_DBUS_NAME = "com.github.radiotray_ng"
+RADIOTRAY_NG_DBUS_PATH = "/com/github/radiotray_ng"
 RADIOTRAY_NG_DEFAULT_POLL_INTERVAL = 1000  # ms
+# Backing off further would save D-Bus calls on a stable stream, but delay reporting track changes
+RADIOTRAY_NG_MAX_POLL_INTERVAL = RADIOTRAY_NG_DEFAULT_POLL_INTERVAL  # ms
+RADIOTRAY_NG_MIN_POLL_INTERVAL = 250  # ms
+RADIOTRAY_NG_PLAYER_STATE_PROPERTIES = ("artist", "image", "mute", "state", "station", "title", "url", "volume")
+# Change signals proposed for the Radiotray-NG D-Bus interface. No released Radiotray-NG version exports them (check
+# with `radiotray-ng --dbus-introspect`), so the player state is polled unless all of them are found by introspection.
+RADIOTRAY_NG_STATE_CHANGE_SIGNALS = ("StateChanged", "SongChanged", "StationChanged", "VolumeChanged", "Muted")
 
 
 logger = logging.getLogger(__name__)
+_MISSING = object()  # Marks player state attributes which were not observed yet
 radiotray_ng_process = None
+radiotray_ng_api: Optional["RadiotrayNgApi"] = None
+main_loop: Optional[GLib.MainLoop] = None
+shutdown_requested = False
 
 
 class RadiotrayNgApi:
-    def __init__(self) -> None:
-        self._session_bus = pydbus.SessionBus()
+    __slots__ = (
+        "_session_bus",
+        "_radiotray_ng_dbus_obj",
+        "_radiotray_ng_dbus_api",
+        "_dbus_get_player_state",
+        "_interface_description",
+        "_has_player_state_properties",
+        "_change_callbacks",
+        "_invalidation_callbacks",
+        "_decoder",
+        "_last_player_state",
+        "_last_player_state_raw",
+        "_bookmarks_cache",
+        "_bookmarks_deadline",
+        "_config_cache",
+        "_config_deadline",
+        "_player_state_cache",
+        "_player_state_deadline",
+    )
+
+    def __init__(self, session_bus: pydbus.bus.Bus, radiotray_ng_dbus_obj: Any) -> None:
+        self._session_bus = session_bus
+        self._radiotray_ng_dbus_obj = radiotray_ng_dbus_obj
+        self._radiotray_ng_dbus_api = self._radiotray_ng_dbus_obj[RADIOTRAY_NG_DBUS_INTERFACE]
+        # pydbus creates a new method wrapper on every attribute access, so look up the polled method only once
+        self._dbus_get_player_state = self._radiotray_ng_dbus_api.get_player_state
+        self._interface_description = self._get_interface_description()
+        # Newer Radiotray-NG versions may export the player state as typed D-Bus properties, which saves the detour
+        # over JSON strings
+        property_names = (
+            {element.attrib["name"].lower() for element in self._interface_description.iter("property")}
+            if self._interface_description is not None
+            else set()
+        )
+        self._has_player_state_properties = property_names.issuperset(RADIOTRAY_NG_PLAYER_STATE_PROPERTIES)
+        self._change_callbacks: list[Callable[[], Any]] = []
+        self._invalidation_callbacks: list[Callable[[], Any]] = []
+        self._decoder = json.JSONDecoder()
+        self._last_player_state: Optional[dict[str, bool | str]] = None
+        self._last_player_state_raw: Optional[str] = None
+        self._bookmarks_cache: Optional[dict[str, bool | str | int]] = None
+        self._bookmarks_deadline = 0.0
+        self._config_cache: Optional[list[dict[str, str | list[dict[str, str]]]]] = None
+        self._config_deadline = 0.0
+        self._player_state_cache: Optional[dict[str, bool | str]] = None
+        self._player_state_deadline = 0.0
+
+    @classmethod
+    def acquire(cls, on_success: Callable[["RadiotrayNgApi"], None], on_error: Callable[[Exception], None]) -> None:
+        """
+        Create an api object as soon as the Radiotray-NG D-Bus service is available.
+
+        Retries are scheduled with GLib timeouts instead of sleeping, so the main loop must be run to complete the
+        acquisition. Exactly one of `on_success` and `on_error` is called.
+        """
+        session_bus = pydbus.SessionBus()
         try_count = 0
-        while True:
+
+        def try_acquire() -> bool:
+            nonlocal try_count
+
             try:
-                self._radiotray_ng_dbus_obj = self._session_bus.get(
-                    "com.github.radiotray_ng", "/com/github/radiotray_ng"
-                )
-                break
+                radiotray_ng_dbus_obj = session_bus.get(RADIOTRAY_NG_DBUS_NAME, RADIOTRAY_NG_DBUS_PATH)
+                api = cls(session_bus, radiotray_ng_dbus_obj)
             except GLib.GError as e:
                 try_count += 1
-                if not (
+                if (
                     e.message.startswith("GDBus.Error:org.freedesktop.DBus.Error.ServiceUnknown")
                     and try_count < MAX_DBUS_GET_TRY_COUNT
                 ):
-                    raise
-                time.sleep(1)
-        self._radiotray_ng_dbus_api = self._radiotray_ng_dbus_obj["com.github.radiotray_ng"]
+                    return True  # Try again after the next timeout
+                on_error(e)
+                return False
+            except Exception as e:
+                on_error(e)
+                return False
+            on_success(api)
+            return False
+
+        if try_acquire():
+            GLib.timeout_add(DBUS_GET_RETRY_INTERVAL, try_acquire)
+
+    def _get_interface_description(self) -> Optional[ElementTree.Element]:
+        try:
+            introspection_xml = self._radiotray_ng_dbus_obj["org.freedesktop.DBus.Introspectable"].Introspect()
+        except (GLib.GError, KeyError):
+            return None
+        return ElementTree.fromstring(introspection_xml).find(
+            "interface[@name='{}']".format(RADIOTRAY_NG_DBUS_INTERFACE)
+        )
+
+    def _on_radiotray_ng_signal(self, *args: Any) -> None:
+        logger.debug("Got a change signal from the radiotray_ng api")
+        self.invalidate_player_state()
+        for change_callback in self._change_callbacks:
+            change_callback()
+
+    def subscribe_to_changes(self, callback: Callable[[], Any]) -> bool:
+        """
+        Call `callback` whenever Radiotray-NG signals a change of its player state.
+
+        Returns `False` if the Radiotray-NG D-Bus interface does not export all change signals (true for all
+        Radiotray-NG versions known so far). In this case, the caller must poll the player state instead.
+        """
+        if self._interface_description is None:
+            return False
+        # Only rely on signals if they cover the whole player state, otherwise changes could be missed
+        signal_names = {signal.attrib["name"] for signal in self._interface_description.iter("signal")}
+        if not signal_names.issuperset(RADIOTRAY_NG_STATE_CHANGE_SIGNALS):
+            return False
+        if not self._change_callbacks:
+            for signal_name in RADIOTRAY_NG_STATE_CHANGE_SIGNALS:
+                getattr(self._radiotray_ng_dbus_api, signal_name).connect(self._on_radiotray_ng_signal)
+        self._change_callbacks.append(callback)
+        return True
+
+    def subscribe_to_invalidation(self, callback: Callable[[], Any]) -> None:
+        """Call `callback` whenever the player state is expected to change, e.g. after a play or volume command."""
+        self._invalidation_callbacks.append(callback)
+
+    def invalidate_player_state(self) -> None:
+        self._player_state_cache = None
+        for invalidation_callback in self._invalidation_callbacks:
+            invalidation_callback()
 
     def get_bookmarks(self) -> dict[str, bool | str | int]:
+        if self._bookmarks_cache is not None and time.monotonic() < self._bookmarks_deadline:
+            return self._bookmarks_cache
         logger.debug('Calling "get_bookmarks" of the radiotray_ng api')
-        bookmarks: dict[str, bool | str | int] = json.loads(self._radiotray_ng_dbus_api.get_bookmarks())
-        logger.debug("Bookmarks:\n%s", pformat(bookmarks))
+        bookmarks: dict[str, bool | str | int] = self._decoder.decode(self._radiotray_ng_dbus_api.get_bookmarks())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bookmarks:\n%s", pformat(bookmarks))
+        self._bookmarks_cache = bookmarks
+        self._bookmarks_deadline = time.monotonic() + BOOKMARKS_CACHE_TTL
         return bookmarks
 
     def get_config(self) -> list[dict[str, str | list[dict[str, str]]]]:
+        if self._config_cache is not None and time.monotonic() < self._config_deadline:
+            return self._config_cache
         logger.debug('Calling "get_config" of the radiotray_ng api')
-        config: list[dict[str, str | list[dict[str, str]]]] = json.loads(self._radiotray_ng_dbus_api.get_config())
-        logger.debug("Config:\n%s", pformat(config))
+        config: list[dict[str, str | list[dict[str, str]]]] = self._decoder.decode(
+            self._radiotray_ng_dbus_api.get_config()
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Config:\n%s", pformat(config))
+        self._config_cache = config
+        self._config_deadline = time.monotonic() + CONFIG_CACHE_TTL
         return config
 
-    def get_player_state(self) -> dict[str, bool | str]:
+    def _get_player_state_from_properties(self) -> dict[str, bool | str]:
+        logger.debug("Reading all properties of the radiotray_ng api")
+        properties: dict[str, bool | str] = self._radiotray_ng_dbus_obj["org.freedesktop.DBus.Properties"].GetAll(
+            RADIOTRAY_NG_DBUS_INTERFACE
+        )
+        player_state = {name.lower(): value for name, value in properties.items()}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player state:\n%s", pformat(player_state))
+        return player_state
+
+    def _get_player_state_from_json(self) -> dict[str, bool | str]:
         logger.debug('Calling "get_player_state" of the radiotray_ng api')
-        player_state: dict[str, bool | str] = json.loads(self._radiotray_ng_dbus_api.get_player_state())
-        logger.debug("Player state:\n%s", pformat(player_state))
+        player_state_raw: str = self._dbus_get_player_state()
+        if player_state_raw == self._last_player_state_raw and self._last_player_state is not None:
+            # Nothing changed since the last query, so reuse the parsed player state (callers do not modify it)
+            return self._last_player_state
+        player_state: dict[str, bool | str] = self._decoder.decode(player_state_raw)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player state:\n%s", pformat(player_state))
+        self._last_player_state_raw = player_state_raw
+        self._last_player_state = player_state
+        return player_state
+
+    def get_player_state(self) -> dict[str, bool | str]:
+        # Collapse bursts of queries (for example all properties requested by an MPRIS client) into one D-Bus call.
+        # If Radiotray-NG signals changes, the last player state is valid until the next signal arrives.
+        if self._player_state_cache is not None and (
+            self._change_callbacks or time.monotonic() < self._player_state_deadline
+        ):
+            return self._player_state_cache
+        if self._has_player_state_properties:
+            player_state = self._get_player_state_from_properties()
+        else:
+            player_state = self._get_player_state_from_json()
+        self._player_state_cache = player_state
+        self._player_state_deadline = time.monotonic() + PLAYER_STATE_CACHE_TTL
         return player_state
 
     def mute(self) -> None:
         logger.debug('Calling "mute" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.mute()
+        self.invalidate_player_state()
 
     def next_station(self) -> None:
         logger.debug('Calling "next_station" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.next_station()
+        self.invalidate_player_state()
 
     def play(self) -> None:
         logger.debug('Calling "play" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.play()
+        self.invalidate_player_state()
 
     def play_station(self, group: str, station: str) -> None:
         logger.debug('Calling "play_station" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.play_station(group, station)
+        self.invalidate_player_state()
 
     def play_url(self, url: str) -> None:
         logger.debug('Calling "play_url" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.play_url(url)
+        self.invalidate_player_state()
 
     def previous_station(self) -> None:
         logger.debug('Calling "previous_station" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.previous_station()
+        self.invalidate_player_state()
 
     def quit(self) -> None:
         logger.debug('Calling "quit" of the radiotray_ng api')
@@ -113,28 +287,43 @@ class RadiotrayNgApi:
     def reload_bookmarks(self) -> None:
         logger.debug('Calling "reload_bookmarks" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.reload_bookmarks()
+        self._bookmarks_cache = None
 
     def set_volume(self, level: int) -> None:
         logger.debug('Calling "set_volume" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.set_volume(str(level))
+        self.invalidate_player_state()
 
     def stop(self) -> None:
         logger.debug('Calling "stop" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.stop()
+        self.invalidate_player_state()
 
     def volume_down(self) -> None:
         logger.debug('Calling "volume_down" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.volume_down()
+        self.invalidate_player_state()
 
     def volume_up(self) -> None:
         logger.debug('Calling "volume_up" of the radiotray_ng api')
         self._radiotray_ng_dbus_api.volume_up()
+        self.invalidate_player_state()
 
 
 class RadiotrayNgMprisAdapter(MprisAdapter):  # type: ignore
+    __slots__ = ("_radiotray_ng_api", "_mute", "_mute_raw", "_volume", "_volume_raw")
+
+    # Radiotray-NG has no track list, so all neighbour track queries can share one immutable empty track
+    _EMPTY_TRACK = Track("")
+
     def __init__(self, radiotray_ng_api: RadiotrayNgApi) -> None:
         super().__init__()
         self._radiotray_ng_api = radiotray_ng_api
+        # Converted values of the last seen raw player state attributes, only converted again after a change
+        self._mute = False
+        self._mute_raw: Optional[bool | str] = None
+        self._volume: Volume = 0.0
+        self._volume_raw: Optional[bool | str] = None
 
     def can_quit(self) -> bool:
         return True
@@ -269,13 +458,22 @@ class RadiotrayNgMprisAdapter(MprisAdapter):  # type: ignore
         return ""
 
     def get_volume(self) -> Volume:
-        return float(self._radiotray_ng_api.get_player_state()["volume"]) / 100
+        volume_raw = self._radiotray_ng_api.get_player_state()["volume"]
+        if volume_raw != self._volume_raw:
+            self._volume = float(volume_raw) / 100
+            self._volume_raw = volume_raw
+        return self._volume
 
     def set_volume(self, val: Volume) -> None:
         self._radiotray_ng_api.set_volume(int(val * 100))
 
     def is_mute(self) -> bool:
-        return bool(self._radiotray_ng_api.get_player_state()["mute"])
+        mute_raw = self._radiotray_ng_api.get_player_state()["mute"]
+        if mute_raw != self._mute_raw:
+            # The mute state may also be passed as string, and `bool("false")` would be `True`
+            self._mute = mute_raw if isinstance(mute_raw, bool) else mute_raw.lower() == "true"
+            self._mute_raw = mute_raw
+        return self._mute
 
     def set_mute(self, val: bool) -> None:
         if val != self.is_mute():
@@ -303,10 +501,10 @@ class RadiotrayNgMprisAdapter(MprisAdapter):  # type: ignore
         return ""
 
     def get_previous_track(self) -> Track:
-        return Track("")
+        return self._EMPTY_TRACK
 
     def get_next_track(self) -> Track:
-        return Track("")
+        return self._EMPTY_TRACK
 
     def activate_playlist(self, id: DbusObj) -> None:
         pass
@@ -346,91 +544,157 @@ class RadiotrayNgMprisAdapter(MprisAdapter):  # type: ignore
 
 
 class RadiotrayNgEventAdapter:
+    __slots__ = (
+        "_radiotray_ng_api",
+        "_mpris_server",
+        "_event_adapter",
+        "_previous_player_state",
+        "_change_handlers",
+        "_watched_keys",
+        "_current_poll_interval",
+        "_poll_source_id",
+        "_main_loop",
+    )
+
     def __init__(
         self,
         radiotray_ng_api: RadiotrayNgApi,
         radiotray_ng_mpris_adapter: RadiotrayNgMprisAdapter,
+        main_loop: GLib.MainLoop,
         poll_interval: int = RADIOTRAY_NG_DEFAULT_POLL_INTERVAL,
     ):
         self._radiotray_ng_api = radiotray_ng_api
+        self._main_loop = main_loop
         self._mpris_server = Server("Radiotray-NG", adapter=radiotray_ng_mpris_adapter)
         self._event_adapter = EventAdapter(root=self._mpris_server.root, player=self._mpris_server.player)
-        self._previous_player_state: Optional[dict[str, bool | str]] = None
+        # Every handler returns the MPRIS event notifier to call (if any), so notifiers are called once per check
+        self._change_handlers: dict[str, Callable[[Any], Optional[Callable[[], None]]]] = {
+            "artist": self._on_changed_artist,
+            "bitrate": self._on_changed_bitrate,
+            "codec": self._on_changed_codec,
+            "group": self._on_changed_group,
+            "image": self._on_changed_image,
+            "mute": self._on_changed_mute,
+            "state": self._on_changed_state,
+            "station": self._on_changed_station,
+            "title": self._on_changed_title,
+            "url": self._on_changed_url,
+            "volume": self._on_changed_volume,
+        }
+        self._watched_keys = tuple(self._change_handlers.keys())
+        # Updated in place on every check to avoid allocating a new dict per poll
+        self._previous_player_state: dict[str, object] = dict.fromkeys(self._watched_keys, _MISSING)
+        self._current_poll_interval = poll_interval
+        self._poll_source_id: Optional[int] = None
         self._enable_event_polling(poll_interval)
 
-    def _enable_event_polling(self, poll_interval: int) -> None:
-        def check_radiotray_state() -> bool:
-            def get_changed_state_attributes() -> dict[str, bool | str]:
-                player_state = self._radiotray_ng_api.get_player_state()
-                if self._previous_player_state is None:
-                    self._previous_player_state = player_state
-                    return {}
-                changed_state_attributes = {
-                    key: value for key, value in player_state.items() if value != self._previous_player_state.get(key)
-                }
-                self._previous_player_state = player_state
-                return changed_state_attributes
-
-            def on_changed_artist(artist: str) -> None:
-                logger.debug('Changed artist: "%s"', artist)
-                self._event_adapter.on_title()
-
-            def on_changed_bitrate(bitrate: str) -> None:
-                logger.debug('Changed bitrate: "%s"', bitrate)
-
-            def on_changed_codec(codec: str) -> None:
-                logger.debug('Changed codec: "%s"', codec)
-
-            def on_changed_group(group: str) -> None:
-                logger.debug('Changed group: "%s"', group)
-
-            def on_changed_image(image: str) -> None:
-                logger.debug('Changed image: "%s"', image)
-
-            def on_changed_mute(mute: bool) -> None:
-                logger.debug('Changed mute: "%s"', str(mute))
-                self._event_adapter.on_volume()
-
-            def on_changed_state(state: str) -> None:
-                logger.debug('Changed state: "%s"', state)
-                if state == "stopped":
-                    self._event_adapter.on_playpause()
-                elif state == "playing":
-                    self._event_adapter.on_playback()
-
-            def on_changed_station(station: str) -> None:
-                logger.debug('Changed station: "%s"', station)
-
-            def on_changed_title(title: str) -> None:
-                logger.debug('Changed title: "%s"', title)
-                self._event_adapter.on_title()
-
-            def on_changed_url(url: str) -> None:
-                logger.debug('Changed url: "%s"', url)
-
-            def on_changed_volume(volume: str) -> None:
-                logger.debug('Changed volume: "%s"', volume)
-                self._event_adapter.on_volume()
-
-            # Terminate if the Radiotray-NG process was terminated by the user
-            if radiotray_ng_process is None or radiotray_ng_process.poll() is not None:
-                logging.info("Radiotray-NG process terminated -> exit")
-                os.kill(os.getpid(), signal.SIGINT)
-                return False
-            changed_state_attributes = get_changed_state_attributes()
-            if changed_state_attributes:
-                logger.info("Changed state attributes:\n%s", pformat(changed_state_attributes))
-            for key, value in changed_state_attributes.items():
-                potential_func_name = f"on_changed_{key}"
-                if potential_func_name in locals() and callable(locals()[potential_func_name]):
-                    locals()[potential_func_name](value)
-
-            return True  # Schedule a new timeout event
+    def _on_changed_artist(self, artist: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed artist: "%s"', artist)
+        return cast(Callable[[], None], self._event_adapter.on_title)
+
+    def _on_changed_bitrate(self, bitrate: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed bitrate: "%s"', bitrate)
+        return None
+
+    def _on_changed_codec(self, codec: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed codec: "%s"', codec)
+        return None
+
+    def _on_changed_group(self, group: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed group: "%s"', group)
+        return None
+
+    def _on_changed_image(self, image: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed image: "%s"', image)
+        return None
+
+    def _on_changed_mute(self, mute: bool) -> Optional[Callable[[], None]]:
+        logger.info('Changed mute: "%s"', str(mute))
+        return cast(Callable[[], None], self._event_adapter.on_volume)
+
+    def _on_changed_state(self, state: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed state: "%s"', state)
+        if state == "stopped":
+            return cast(Callable[[], None], self._event_adapter.on_playpause)
+        elif state == "playing":
+            return cast(Callable[[], None], self._event_adapter.on_playback)
+        return None
+
+    def _on_changed_station(self, station: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed station: "%s"', station)
+        return None
+
+    def _on_changed_title(self, title: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed title: "%s"', title)
+        return cast(Callable[[], None], self._event_adapter.on_title)
+
+    def _on_changed_url(self, url: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed url: "%s"', url)
+        return None
+
+    def _on_changed_volume(self, volume: str) -> Optional[Callable[[], None]]:
+        logger.info('Changed volume: "%s"', volume)
+        return cast(Callable[[], None], self._event_adapter.on_volume)
+
+    def _dispatch_changed_state_attributes(self, player_state: dict[str, bool | str]) -> bool:
+        # Only compare keys which have a handler and call the handler right away, without building a diff first
+        previous_player_state = self._previous_player_state
+        has_changed = False
+        # Collect the notifiers first, so for example a changed artist and title emit only one D-Bus signal. A dict
+        # is used as an ordered set, so the signals are emitted in the order of the watched keys.
+        notifiers: dict[Callable[[], None], None] = {}
+        for key in self._watched_keys:
+            value = player_state.get(key)
+            previous_value = previous_player_state[key]
+            if value != previous_value:
+                previous_player_state[key] = value
+                # The first observed value is the initial state, not a change
+                if previous_value is not _MISSING:
+                    notifier = self._change_handlers[key](value)
+                    if notifier is not None:
+                        notifiers[notifier] = None
+                    has_changed = True
+        for notifier in notifiers:
+            notifier()
+        return has_changed
+
+    def _check_radiotray_state(self) -> None:
+        self._dispatch_changed_state_attributes(self._radiotray_ng_api.get_player_state())
+
+    def _poll_radiotray_state(self) -> bool:
+        # Poll quickly after a change (e.g. a track transition) and back off while the player state is stable
+        if self._dispatch_changed_state_attributes(self._radiotray_ng_api.get_player_state()):
+            self._current_poll_interval = RADIOTRAY_NG_MIN_POLL_INTERVAL
+        else:
+            self._current_poll_interval = min(2 * self._current_poll_interval, RADIOTRAY_NG_MAX_POLL_INTERVAL)
+        self._poll_source_id = GLib.timeout_add(self._current_poll_interval, self._poll_radiotray_state)
+        return False  # A new timeout event with the adapted interval was already scheduled
+
+    def _on_player_state_invalidated(self) -> None:
+        # A command was sent to Radiotray-NG, so poll soon to report its effect without the backoff delay
+        if self._current_poll_interval == RADIOTRAY_NG_MIN_POLL_INTERVAL:
+            return
+        self._current_poll_interval = RADIOTRAY_NG_MIN_POLL_INTERVAL
+        if self._poll_source_id is not None:
+            GLib.source_remove(self._poll_source_id)
+        self._poll_source_id = GLib.timeout_add(self._current_poll_interval, self._poll_radiotray_state)
 
-        GLib.timeout_add(poll_interval, check_radiotray_state)
+    def _enable_event_polling(self, poll_interval: int) -> None:
+        # A terminated Radiotray-NG process is detected by a child watch (see `start_radiotray_ng`), so no polling is
+        # needed at all if Radiotray-NG pushes its state changes
+        if self._radiotray_ng_api.subscribe_to_changes(self._check_radiotray_state):
+            logger.info("Radiotray-NG emits change signals -> disable polling")
+        else:
+            self._poll_source_id = GLib.timeout_add(poll_interval, self._poll_radiotray_state)
+            self._radiotray_ng_api.subscribe_to_invalidation(self._on_player_state_invalidated)
 
     def publish_and_loop(self) -> None:
-        self._mpris_server.loop()
+        # Run the main loop directly instead of `Server.loop()`, so it can be shared with the signal handlers
+        self._mpris_server.publish()
+        try:
+            self._main_loop.run()
+        finally:
+            self._mpris_server.unpublish()
 
 
 def start_radiotray_ng(play: bool) -> subprocess.Popen[str]:
@@ -440,21 +704,48 @@ def start_radiotray_ng(play: bool) -> subprocess.Popen[str]:
     if play:
         args.append("--play")
     radiotray_ng_process = subprocess.Popen(args, universal_newlines=True)
+
+    def on_radiotray_ng_exit(pid: int, status: int) -> None:
+        global shutdown_requested
+
+        # Terminate if the Radiotray-NG process was terminated by the user
+        logger.info("Radiotray-NG process terminated -> exit")
+        shutdown_requested = True
+        if main_loop is not None:
+            main_loop.quit()
+
+    GLib.child_watch_add(GLib.PRIORITY_DEFAULT, radiotray_ng_process.pid, on_radiotray_ng_exit)
     return radiotray_ng_process
 
 
-def setup_signal_handling() -> None:
-    def handle_sigint_sigterm(sig: int, frame: Optional[FrameType]) -> None:
-        logger.debug("Got signal %s", signal.Signals(sig).name)
-        if radiotray_ng_process is not None and radiotray_ng_process.poll() is None:
+def stop_radiotray_ng() -> None:
+    if radiotray_ng_process is not None and radiotray_ng_process.poll() is None:
+        if radiotray_ng_api is not None:
             logger.info("Send a quit request to Radiotray NG")
             try:
-                RadiotrayNgApi().quit()
+                radiotray_ng_api.quit()
             except GLib.GError:
                 # Quiting without replying DBus queries raises an GError
                 pass
-            logger.info("Waiting for the process to quit...")
-            radiotray_ng_process.wait()
+        else:
+            # The D-Bus service has not been acquired yet
+            logger.info("Terminate Radiotray NG")
+            radiotray_ng_process.terminate()
+        logger.info("Waiting for the process to quit...")
+        radiotray_ng_process.wait()
+
+
+def setup_signal_handling() -> None:
+    def handle_sigint_sigterm(sig: int, frame: Optional[FrameType]) -> None:
+        global shutdown_requested
+
+        logger.debug("Got signal %s", signal.Signals(sig).name)
+        if main_loop is not None and main_loop.is_running():
+            shutdown_requested = True
+            # `wrap_radiotray_ng` stops Radiotray-NG after the main loop has returned
+            main_loop.quit()
+            return
+        stop_radiotray_ng()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, handle_sigint_sigterm)
@@ -462,8 +753,41 @@ def setup_signal_handling() -> None:
 
 
 def wrap_radiotray_ng(play: bool) -> None:
+    global main_loop
+
+    main_loop = GLib.MainLoop()
     start_radiotray_ng(play)
-    radiotray_ng_api = RadiotrayNgApi()
-    radiotray_ng_mpris_adapter = RadiotrayNgMprisAdapter(radiotray_ng_api)
-    radiotray_ng_event_adapter = RadiotrayNgEventAdapter(radiotray_ng_api, radiotray_ng_mpris_adapter)
-    radiotray_ng_event_adapter.publish_and_loop()
+    try:
+        # Wait for the D-Bus service in the main loop, so signals (e.g. from a terminated Radiotray-NG process) are
+        # handled
+        acquisition_errors: list[Exception] = []
+
+        def on_acquired(api: RadiotrayNgApi) -> None:
+            global radiotray_ng_api
+
+            radiotray_ng_api = api
+            if main_loop is not None:
+                main_loop.quit()
+
+        def on_acquisition_error(e: Exception) -> None:
+            acquisition_errors.append(e)
+            if main_loop is not None:
+                main_loop.quit()
+
+        RadiotrayNgApi.acquire(on_acquired, on_acquisition_error)
+        # The service may have been acquired (or failed) synchronously, quitting a loop before it runs has no effect
+        if radiotray_ng_api is None and not acquisition_errors:
+            main_loop.run()
+        if acquisition_errors:
+            raise acquisition_errors[0]
+        # The loop may also have been quit for a shutdown in the same iteration in which the service was acquired
+        if radiotray_ng_api is not None and not shutdown_requested:
+            radiotray_ng_mpris_adapter = RadiotrayNgMprisAdapter(radiotray_ng_api)
+            radiotray_ng_event_adapter = RadiotrayNgEventAdapter(
+                radiotray_ng_api, radiotray_ng_mpris_adapter, main_loop
+            )
+            radiotray_ng_event_adapter.publish_and_loop()
+    finally:
+        # Also stop Radiotray-NG if waiting for its D-Bus service or setting up the MPRIS server failed, so the process
+        # is not orphaned
+        stop_radiotray_ng()
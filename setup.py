@@ -1,10 +1,10 @@
 import os
-import runpy
+import re
 import subprocess
 from tempfile import TemporaryDirectory
-from typing import List, Optional, Tuple, cast
+from typing import List, Optional, Tuple
 
-from setuptools import Command, find_packages, setup
+from setuptools import Command, setup
 
 
 class PyinstallerCommand(Command):
@@ -50,8 +50,11 @@ if __name__ == "__main__":
 
 
 def get_version_from_pyfile(version_file: str = "radiotray_ng_mpris/_version.py") -> str:
-    file_globals = runpy.run_path(version_file)
-    return cast(str, file_globals["__version__"])
+    with open(version_file, "r", encoding="utf-8") as f:
+        match = re.search(r"^__version_info__ = \(([^)]*)\)", f.read(), re.MULTILINE)
+    if match is None:
+        raise RuntimeError('Could not find "__version_info__" in "{}"'.format(version_file))
+    return ".".join(part.strip() for part in match.group(1).split(",") if part.strip())
 
 
 def get_long_description_from_readme(readme_filename: str = "README.md") -> str:
@@ -68,7 +71,7 @@ long_description = get_long_description_from_readme()
 setup(
     name="radiotray-ng-mpris",
     version=version,
-    packages=find_packages(),
+    packages=["radiotray_ng_mpris"],
     python_requires="~=3.10",
     install_requires=[
         "mpris-server",